@@ -4,13 +4,13 @@ Run: python main.py
 
 This is the entrypoint for the Recipe Suggestion Helper CLI.
 """
-from src.recipe_helper import parse_ingredients, match_recipes, explain_recipe, suggest_substitute, get_available_diets
+from src.recipe_helper import parse_ingredients, match_recipes, explain_recipe, suggest_substitute, get_available_diets, similar_recipes
 from src.openai_helper import ask_openai
+from src.meal_plan import plan_meals
 import os
 import sys
 import json
 import re
-from datetime import datetime
 
 
 def _safe_filename(title: str) -> str:
@@ -18,11 +18,40 @@ def _safe_filename(title: str) -> str:
     return re.sub(r"[^0-9a-zA-Z_-]", "_", title).strip("_")
 
 
+def follow_up_intent(q: str) -> str:
+    """Name the follow-up branch main() takes for answer `q`.
+
+    Returns one of "exit", "confirm", "meal_plan", "substitute", "time",
+    "explain", or "ask_openai" for free-form questions. Shared with
+    scripts/replay_sessions.py so its step labels match the branch that ran.
+    """
+    q = q.lower()
+    if q in ("exit", "quit", "no"):
+        return "exit"
+    if "want to make this" in q:
+        return "confirm"
+    if "meal plan" in q or "plan my week" in q:
+        return "meal_plan"
+    if "i don't have" in q or "dont have" in q:
+        return "substitute"
+    if "time" in q or "how long" in q:
+        return "time"
+    if "steps" in q or "how do i" in q:
+        return "explain"
+    return "ask_openai"
+
+
 def ask_user(prompt: str) -> str:
     return input(prompt + "\n> ").strip()
 
 
-def main():
+def main(ask_user=ask_user, ask_openai=ask_openai, base_dir=""):
+    """Run one conversation.
+
+    `ask_user` and `ask_openai` can be swapped for stubs (e.g. by
+    scripts/replay_sessions.py), and `base_dir` sets where saved recipes and
+    recipe cards are written (default: current directory).
+    """
     print("Hi! I'm your Recipe Suggestion Helper.")
     print()
     
@@ -41,17 +70,28 @@ def main():
         sys.exit(0)
 
     matches = match_recipes(ingredients, min_match=2, diet=diet_filter)
+    similar = []
     if not matches:
         print("Sorry, I couldn't find recipes matching at least 2 of your ingredients")
         if diet_filter:
             print(f"with the '{diet_filter}' dietary requirement.")
-        print("Try adding more ingredients or removing dietary filters.")
-        sys.exit(0)
+        # Fall back to the precomputed "similar recipes" table
+        similar = similar_recipes(ingredients=ingredients, k=3, diet=diet_filter)
+        if not similar:
+            print("Try adding more ingredients or removing dietary filters.")
+            sys.exit(0)
+        matches = similar
 
-    print("Great! Here are some recipes you can make:")
+    if similar:
+        print("Here are some similar recipes you might try instead:")
+    else:
+        print("Great! Here are some recipes you can make:")
     for i, (r, count) in enumerate(matches[:3], 1):
         diets_str = f" — {', '.join(r.get('diets', []))}" if r.get('diets') else ""
-        print(f"{i}. {r.get('title')} ({r.get('time')}){diets_str} — matches {count} ingredient(s)")
+        if similar:
+            print(f"{i}. {r.get('title')} ({r.get('time')}){diets_str} — {round(count * 100)}% similar")
+        else:
+            print(f"{i}. {r.get('title')} ({r.get('time')}){diets_str} — matches {count} ingredient(s)")
 
     choice = ask_user("Which number would you like to know more about, or type a recipe name? (or 'no' to exit)")
     if choice.lower() in ('no', 'n', 'exit', 'quit'):
@@ -96,7 +136,7 @@ def main():
 
     while True:
         try:
-            q = ask_user("Anything else? Ask for substitutions, time, or 'want to make this' to confirm, or 'exit'")
+            q = ask_user("Anything else? Ask for substitutions, time, 'meal plan' for a week of recipes, or 'want to make this' to confirm, or 'exit'")
         except (EOFError, KeyboardInterrupt):
             print("\nInput closed. Exiting.")
             break
@@ -105,13 +145,14 @@ def main():
         if not q:
             continue
 
-        if q.lower() in ("exit", "quit", "no"):
+        intent = follow_up_intent(q)
+        if intent == "exit":
             print("Bye — happy cooking!")
             break
         # New: handle confirmation flow
-        if "want to make this" in q.lower() or q.lower().strip() == "want to make this":
+        if intent == "confirm":
             # Show shopping list vs available ingredients
-            have = [i.lower() for i in ingredients]
+            have = set(i.lower() for i in ingredients)
             recipe_ings = selected.get("ingredients", [])
             missing = [ing for ing in recipe_ings if ing.lower() not in have]
             print("\nGreat — preparing this recipe for you.")
@@ -127,7 +168,10 @@ def main():
             # Offer to save recipe and write a printable recipe card
             save = ask_user("Save this recipe to your saved list and create a recipe card? (y/n)")
             if save.lower() in ("y", "yes"):
-                saved_path = os.path.join("saved_recipes.json")
+                # Only needed when saving, so keep it off the startup path
+                from datetime import datetime
+
+                saved_path = os.path.join(base_dir, "saved_recipes.json")
                 try:
                     if os.path.exists(saved_path):
                         with open(saved_path, "r", encoding="utf-8") as f:
@@ -141,7 +185,7 @@ def main():
                 with open(saved_path, "w", encoding="utf-8") as f:
                     json.dump(saved, f, indent=2)
                 # create a simple recipe card file
-                card_dir = os.path.join("saved_cards")
+                card_dir = os.path.join(base_dir, "saved_cards")
                 os.makedirs(card_dir, exist_ok=True)
                 fname = _safe_filename(selected.get("title", "recipe")) + ".txt"
                 card_path = os.path.join(card_dir, fname)
@@ -171,27 +215,42 @@ def main():
                 print(f"Saved to {saved_path} and created recipe card at {card_path}")
 
             # Timers suggestion based on recipe time
-            t = selected.get("time", "")
-            m = re.search(r"(\d+)", t)
-            if m:
-                total = int(m.group(1))
+            total = selected.get("minutes")
+            if total is not None:
                 prep = max(5, total // 4)
                 cook = max(5, total - prep)
                 print(f"Suggested timers: prep ~{prep} minutes, cook ~{cook} minutes (total {total} minutes)")
             else:
                 print("Suggested timers: prep ~10 minutes, cook ~15 minutes")
             continue
-        if "i don't have" in q.lower() or "dont have" in q.lower():
+        if intent == "meal_plan":
+            # Pick a week of recipes that share the pantry and each other's ingredients
+            plan = plan_meals(ingredients, n=7, diet=diet_filter)
+            if not plan["recipes"]:
+                print("I couldn't find enough recipes for a meal plan with those ingredients.")
+                continue
+            print(f"\nMeal plan ({len(plan['recipes'])} recipes):")
+            for i, r in enumerate(plan["recipes"], 1):
+                print(f"{i}. {r.get('title')} ({r.get('time')})")
+            print("Uses from your pantry: " + (", ".join(plan["pantry_used"]) or "nothing"))
+            print("Shopping list:")
+            if plan["shopping_list"]:
+                for ing in plan["shopping_list"]:
+                    print(f" - {ing}")
+            else:
+                print(" - (nothing to buy)")
+            continue
+        if intent == "substitute":
             part = q.lower().split("have", 1)[-1].strip()
             sub = suggest_substitute(part)
             print(sub)
             continue
         # For now we use the simple built-in responder in recipe_helper for basic questions
         # (openai integration can be added later)
-        if "time" in q.lower() or "how long" in q.lower():
+        if intent == "time":
             print(f"This recipe takes about {selected.get('time')}")
             continue
-        if "steps" in q.lower() or "how do i" in q.lower():
+        if intent == "explain":
             print(explain_recipe(selected))
             continue
         # Try OpenAI for richer free-form follow-ups when configured
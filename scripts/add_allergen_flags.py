@@ -2,13 +2,19 @@
 """
 Add allergen flags to recipes.json using a best-effort keyword mapping.
 
-Run: python3 scripts/add_allergen_flags.py
-This updates `recipes.json` in place and prints a short report.
+Run: python3 scripts/add_allergen_flags.py [path/to/catalog.json|.jsonl]
+This updates `recipes.json` in place and prints a short report. Recipes are
+streamed one at a time, so memory use does not grow with catalog size.
 """
-import json
+import sys
 from pathlib import Path
 
 BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+
+from scripts.build_neighbors import write_neighbor_table  # noqa: E402
+from src.catalog_io import iter_recipes, write_recipes  # noqa: E402
+
 RPATH = BASE / "recipes.json"
 
 ALLERGEN_MAP = {
@@ -52,15 +58,9 @@ def detect_allergens(ingredients):
                     found.add(allergen)
     return sorted(list(found))
 
-def main():
-    if not RPATH.exists():
-        print("recipes.json not found; aborting")
-        return
-    with open(RPATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    updated = 0
-    for r in data:
+def tag_allergens(recipes, counts):
+    """Generator stage: add an `allergens` field and tally allergen counts."""
+    for r in recipes:
         ingredients = r.get("ingredients", [])
         allergens = detect_allergens(ingredients)
         if allergens:
@@ -68,19 +68,26 @@ def main():
         else:
             # Ensure key exists as empty list for clarity
             r.setdefault("allergens", [])
-        updated += 1
+        for a in r.get("allergens", []):
+            counts[a] = counts.get(a, 0) + 1
+        yield r
 
-    # Write back (overwrite)
-    with open(RPATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def main():
+    rpath = Path(sys.argv[1]) if len(sys.argv) > 1 else RPATH
+    if not rpath.exists():
+        print(f"{rpath.name} not found; aborting")
+        return
 
-    # Short report
+    # Read -> tag -> write (atomic swap once everything is written)
     counts = {}
-    for r in data:
-        for a in r.get("allergens", []):
-            counts[a] = counts.get(a, 0) + 1
+    updated = write_recipes(str(rpath), tag_allergens(iter_recipes(str(rpath)), counts))
+
+    if rpath.resolve() == RPATH.resolve():
+        # The similar-recipes table is keyed by the catalog's hash
+        write_neighbor_table(rpath)
 
-    print(f"Updated {len(data)} recipes with 'allergens' field (best-effort tagging).")
+    # Short report
+    print(f"Updated {updated} recipes with 'allergens' field (best-effort tagging).")
     if counts:
         print("Allergen counts:")
         for a, c in sorted(counts.items(), key=lambda x: -x[1]):
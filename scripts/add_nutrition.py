@@ -4,13 +4,19 @@ Add simple nutrition estimates to recipes.json using a best-effort ingredient-ba
 
 Estimates are rough approximations per serving and should NOT be used for medical/diet purposes.
 
-Run: python3 scripts/add_nutrition.py
+Run: python3 scripts/add_nutrition.py [path/to/catalog.json|.jsonl]
 This updates `recipes.json` in place with a `nutrition` field per recipe.
+Recipes are streamed one at a time, so memory use does not grow with catalog size.
 """
-import json
+import sys
 from pathlib import Path
 
 BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+
+from scripts.build_neighbors import write_neighbor_table  # noqa: E402
+from src.catalog_io import iter_recipes, write_recipes  # noqa: E402
+
 RPATH = BASE / "recipes.json"
 
 # Per-ingredient estimates (simplified, per ~1 unit/serving)
@@ -94,30 +100,34 @@ def estimate_nutrition(ingredients):
         "fat_g": round(total_fat, 1),
     }
 
+def add_nutrition(recipes, samples, sample_size=3):
+    """Generator stage: add a `nutrition` field, keeping the first few as samples."""
+    for r in recipes:
+        ingredients = r.get("ingredients", [])
+        r["nutrition"] = estimate_nutrition(ingredients)
+        if len(samples) < sample_size:
+            samples.append((r.get("title"), r["nutrition"]))
+        yield r
+
 def main():
-    if not RPATH.exists():
-        print("recipes.json not found; aborting")
+    rpath = Path(sys.argv[1]) if len(sys.argv) > 1 else RPATH
+    if not rpath.exists():
+        print(f"{rpath.name} not found; aborting")
         return
 
-    with open(RPATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    updated = 0
-    for r in data:
-        ingredients = r.get("ingredients", [])
-        nutrition = estimate_nutrition(ingredients)
-        r["nutrition"] = nutrition
-        updated += 1
+    # Read -> estimate -> write (atomic swap once everything is written)
+    samples = []
+    updated = write_recipes(str(rpath), add_nutrition(iter_recipes(str(rpath)), samples))
 
-    with open(RPATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if rpath.resolve() == RPATH.resolve():
+        # The similar-recipes table is keyed by the catalog's hash
+        write_neighbor_table(rpath)
 
     print(f"Updated {updated} recipes with nutrition estimates.")
     print("Estimates are rough and should NOT be used for medical/diet purposes.")
     print("Sample recipe nutrition:")
-    for r in data[:3]:
-        n = r.get("nutrition", {})
-        print(f" - {r.get('title')}: {n.get('calories')} cal, {n.get('protein_g')}g protein, {n.get('carbs_g')}g carbs, {n.get('fat_g')}g fat")
+    for title, n in samples:
+        print(f" - {title}: {n.get('calories')} cal, {n.get('protein_g')}g protein, {n.get('carbs_g')}g carbs, {n.get('fat_g')}g fat")
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI startup time and enforce a budget.
+
+Measures (median of --runs):
+- interpreter baseline: `python -c pass`
+- CLI startup: `python -c "import main"` (all imports + catalog load, i.e.
+  everything that happens before the greeting is printed)
+- catalog load from JSON (cold) vs from the snapshot (warm), in-process
+
+Run: python3 scripts/bench_startup.py [--runs 10] [--budget-ms 150]
+Exits with status 1 if the median CLI startup exceeds the budget, or if the
+openai SDK gets imported during startup, so it can gate CI
+(tests/test_startup.py runs it with a stub openai package).
+Set RECIPES_SNAPSHOT_PATH to keep the snapshot it builds out of the checkout.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+
+
+def time_command(args, runs):
+    """Median wall time (ms) of running a command `runs` times."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=str(BASE), check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def time_call(fn, runs):
+    """Median wall time (ms) of calling fn() `runs` times."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup time.")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement (default: 10)")
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="Max median CLI startup in ms (default: 150)")
+    args = parser.parse_args()
+
+    py = sys.executable
+    # Warm-up import: makes sure a valid snapshot exists before timing
+    subprocess.run([py, "-c", "import main"], cwd=str(BASE), check=True)
+
+    baseline = time_command([py, "-c", "pass"], args.runs)
+    startup = time_command([py, "-c", "import main"], args.runs)
+    check = subprocess.run(
+        [py, "-c", "import sys, main; print('openai' in sys.modules)"],
+        cwd=str(BASE), check=True, capture_output=True, text=True,
+    )
+    openai_imported = check.stdout.strip() == "True"
+
+    from src.recipe_helper import RECIPES_PATH, load_catalog
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snap = os.path.join(tmp, "recipes.snapshot")
+
+        def cold():
+            if os.path.exists(snap):
+                os.remove(snap)
+            load_catalog(RECIPES_PATH, snap)
+
+        cold_ms = time_call(cold, args.runs)
+        load_catalog(RECIPES_PATH, snap)
+        warm_ms = time_call(lambda: load_catalog(RECIPES_PATH, snap), args.runs)
+
+    print(f"Interpreter baseline:      {baseline:8.1f} ms")
+    print(f"CLI startup (import main): {startup:8.1f} ms  (budget {args.budget_ms:.0f} ms)")
+    print(f"Catalog load, JSON:        {cold_ms:8.1f} ms")
+    print(f"Catalog load, snapshot:    {warm_ms:8.1f} ms")
+    print(f"openai imported at startup: {'yes' if openai_imported else 'no'}")
+
+    failed = False
+    if startup > args.budget_ms:
+        print(f"FAIL: startup {startup:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+    if openai_imported:
+        print("FAIL: openai SDK should be imported lazily")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Precompute a "similar recipes" nearest-neighbour table for recipes.json.
+
+Candidate neighbours are found with MinHash + LSH over ingredient tokens (no
+all-pairs comparison), then ranked by exact ingredient Jaccard similarity.
+The top --k neighbours per recipe are written to recipes_neighbors.json next
+to the catalog, together with the catalog's SHA-256 so a stale table is
+ignored at query time (see similar_recipes in src/recipe_helper.py).
+
+Run: python3 scripts/build_neighbors.py [--k 10]
+Re-run after editing recipes.json by hand; add_allergen_flags.py,
+add_nutrition.py and generate_recipes.py rebuild it themselves.
+"""
+import argparse
+import heapq
+import json
+import sys
+from array import array
+from pathlib import Path
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+
+from src.catalog_io import file_digest, iter_recipes  # noqa: E402
+from src.similarity import band_keys, jaccard, minhash_signature, recipe_tokens  # noqa: E402
+
+RPATH = BASE / "recipes.json"
+NPATH = BASE / "recipes_neighbors.json"
+
+# More, shorter bands than dedup: we want loosely similar recipes too.
+# 32 bands of 2 rows catch pairs from roughly 0.2 Jaccard upwards.
+NEIGHBOR_BANDS = 32
+
+
+def _offer(heap, k, score, j):
+    # Keep the k best (score, neighbour) pairs; a pair can be offered once per
+    # shared band, so skip neighbours already present.
+    for _, existing in heap:
+        if existing == j:
+            return
+    if len(heap) < k:
+        heapq.heappush(heap, (score, j))
+    elif score > heap[0][0]:
+        heapq.heapreplace(heap, (score, j))
+
+
+def build_neighbors(recipes, k=10, bands=NEIGHBOR_BANDS, max_bucket=64):
+    """Build the top-k ingredient-similarity neighbours for every recipe.
+
+    Args:
+        recipes: Iterable of recipe dicts (e.g. streamed with iter_recipes)
+        k: Neighbours to keep per recipe
+        bands: Number of LSH bands (must divide NUM_PERM)
+        max_bucket: Only the first max_bucket members of an LSH bucket are
+            compared, which bounds the work for very common ingredient combos
+
+    Returns:
+        List (aligned with recipes) of [[neighbour index, similarity], ...]
+        sorted by similarity, best first
+    """
+    vocab = {}
+    ing_sets = []
+    keys = [array("q") for _ in range(bands)]
+    for n, r in enumerate(recipes):
+        tokens = recipe_tokens(r, include_title=False)
+        ing_sets.append(frozenset(vocab.setdefault(t, len(vocab)) for t in tokens))
+        sig = minhash_signature(tokens)
+        bk = band_keys(sig, bands) if sig is not None else [-(n + 1)] * bands
+        for b in range(bands):
+            keys[b].append(bk[b])
+
+    n = len(ing_sets)
+    heaps = [[] for _ in range(n)]
+    for band in keys:
+        order = sorted(range(n), key=band.__getitem__)
+        start = 0
+        while start < n:
+            end = start + 1
+            while end < n and band[order[end]] == band[order[start]]:
+                end += 1
+            members = order[start:min(end, start + max_bucket)]
+            for x, i in enumerate(members):
+                a = ing_sets[i]
+                for j in members[x + 1:]:
+                    score = jaccard(a, ing_sets[j])
+                    _offer(heaps[i], k, score, j)
+                    _offer(heaps[j], k, score, i)
+            start = end
+
+    return [[[j, round(score, 3)] for score, j in sorted(h, key=lambda p: (-p[0], p[1]))] for h in heaps]
+
+
+def write_neighbor_table(catalog, output=NPATH, k=10):
+    """Build the neighbour table for a catalog file and write it to output.
+
+    Scripts that rewrite recipes.json call this too, so the table never goes
+    stale after them.
+
+    Returns:
+        (recipes in the table, recipes with at least one neighbour)
+    """
+    neighbors = build_neighbors(iter_recipes(str(catalog)), k=k)
+    table = {
+        "source_sha256": file_digest(catalog),
+        "count": len(neighbors),
+        "k": k,
+        "neighbors": neighbors,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(table, f, separators=(",", ":"))
+    return len(neighbors), sum(1 for row in neighbors if row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the similar-recipes neighbour table.")
+    parser.add_argument("--catalog", default=str(RPATH), help="Recipe catalog (default: recipes.json)")
+    parser.add_argument("--output", default=str(NPATH), help="Output table (default: recipes_neighbors.json)")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per recipe (default: 10)")
+    args = parser.parse_args()
+
+    path = Path(args.catalog)
+    if not path.exists():
+        print(f"{path.name} not found; aborting")
+        return
+
+    count, covered = write_neighbor_table(path, args.output, k=args.k)
+    print(f"Wrote neighbours for {count} recipes to {args.output} ({covered} with at least one neighbour).")
+
+
+if __name__ == '__main__':
+    main()
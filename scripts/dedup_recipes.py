@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Find near-duplicate recipes in recipes.json using MinHash + LSH.
+
+Each recipe gets a MinHash signature over its ingredient and title tokens.
+Signatures are split into LSH bands; only recipes that share a band bucket
+are compared, so the catalog is never compared all-pairs. Candidate pairs
+whose estimated similarity reaches --threshold are merged into clusters.
+
+Memory stays bounded: the catalog is streamed (src/catalog_io.py), and
+signatures and band keys are kept in compact arrays (about
+NUM_PERM * 4 + NUM_BANDS * 8 bytes per recipe), with no per-pair storage.
+
+Run: python3 scripts/dedup_recipes.py [--threshold 0.7] [--show 10]
+     python3 scripts/dedup_recipes.py --output recipes_dedup.json
+This prints a cluster report and optionally writes a deduplicated catalog
+(keeping the first recipe of each cluster).
+"""
+import argparse
+import sys
+from array import array
+from pathlib import Path
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+
+from src.catalog_io import iter_recipes, write_recipes  # noqa: E402
+from src.similarity import NUM_BANDS, NUM_PERM, band_keys, estimate_similarity, minhash_signature, recipe_tokens  # noqa: E402
+
+RPATH = BASE / "recipes.json"
+
+
+def _find(parent, i):
+    # Union-find with path halving
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union(parent, a, b):
+    ra, rb = _find(parent, a), _find(parent, b)
+    if ra != rb:
+        # Keep the earliest recipe as the cluster root
+        if ra < rb:
+            parent[rb] = ra
+        else:
+            parent[ra] = rb
+
+
+def find_clusters(recipes, threshold=0.7, bands=NUM_BANDS, max_bucket=64):
+    """Cluster near-duplicate recipes.
+
+    Args:
+        recipes: Iterable of recipe dicts
+        threshold: Minimum estimated Jaccard similarity to merge two recipes
+        bands: Number of LSH bands
+        max_bucket: Each bucket member is compared with at most this many
+            earlier members, so buckets up to this size are compared pairwise
+            and very large buckets still cost linear time
+
+    Returns:
+        (number of recipes scanned, {root index: [member indices]}) for
+        clusters with more than one recipe
+    """
+    sigs = array("I")
+    keys = [array("q") for _ in range(bands)]
+    n = 0
+    for r in recipes:
+        sig = minhash_signature(recipe_tokens(r))
+        if sig is None:
+            # Empty recipes never match anything: give them a unique bucket
+            sig = (0xFFFFFFFF,) * NUM_PERM
+            bk = [-(n + 1)] * bands
+        else:
+            bk = band_keys(sig, bands)
+        sigs.extend(sig)
+        for b in range(bands):
+            keys[b].append(bk[b])
+        n += 1
+
+    parent = array("l", range(n))
+
+    def sig_at(i):
+        return sigs[i * NUM_PERM:(i + 1) * NUM_PERM]
+
+    for band in keys:
+        order = sorted(range(n), key=band.__getitem__)
+        start = 0
+        while start < n:
+            end = start + 1
+            while end < n and band[order[end]] == band[order[start]]:
+                end += 1
+            for x in range(start + 1, end):
+                j = order[x]
+                j_sig = sig_at(j)
+                for i in order[max(start, x - max_bucket):x]:
+                    if _find(parent, i) != _find(parent, j) and estimate_similarity(sig_at(i), j_sig) >= threshold:
+                        _union(parent, i, j)
+            start = end
+
+    clusters = {}
+    for i in range(n):
+        root = _find(parent, i)
+        if root != i:
+            clusters.setdefault(root, [root]).append(i)
+    return n, clusters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate recipes with MinHash/LSH.")
+    parser.add_argument("--catalog", default=str(RPATH), help="Recipe catalog to scan (default: recipes.json)")
+    parser.add_argument("--threshold", type=float, default=0.7, help="Estimated Jaccard similarity needed to merge (default: 0.7)")
+    parser.add_argument("--bands", type=int, default=NUM_BANDS, help=f"LSH bands; must divide {NUM_PERM} (default: {NUM_BANDS})")
+    parser.add_argument("--max-bucket", type=int, default=64, help="Earlier bucket members each recipe is compared with (default: 64)")
+    parser.add_argument("--show", type=int, default=10, help="How many clusters to print (default: 10)")
+    parser.add_argument("--output", help="Write a deduplicated catalog to this path")
+    args = parser.parse_args()
+
+    if NUM_PERM % args.bands:
+        parser.error(f"--bands must divide {NUM_PERM}")
+    path = Path(args.catalog)
+    if not path.exists():
+        print(f"{path.name} not found; aborting")
+        return
+
+    n, clusters = find_clusters(iter_recipes(str(path)), threshold=args.threshold, bands=args.bands,
+                                max_bucket=args.max_bucket)
+
+    dupes = sum(len(members) - 1 for members in clusters.values())
+    print(f"Scanned {n} recipes: {len(clusters)} near-duplicate cluster(s), {dupes} redundant recipe(s).")
+    biggest = sorted(clusters.values(), key=lambda m: (-len(m), m[0]))[:args.show]
+    # Second pass: fetch titles only for the clusters being shown
+    wanted = {i for members in biggest for i in members[:5]}
+    titles = {i: r.get("title") for i, r in enumerate(iter_recipes(str(path))) if i in wanted}
+    for members in biggest:
+        shown = [titles[i] for i in members[:5]]
+        print(f" - {len(members)} recipes: {', '.join(shown)}{' ...' if len(members) > 5 else ''}")
+
+    if args.output:
+        drop = {i for members in clusters.values() for i in members[1:]}
+        kept = write_recipes(args.output, (r for i, r in enumerate(iter_recipes(str(path))) if i not in drop))
+        print(f"Wrote {kept} recipes to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
 """
-Generate and append 100 simple recipe entries to `recipes.json`.
+Generate and append simple recipe entries to `recipes.json` (100 by default).
 
-Run: python scripts/generate_recipes.py
+Run: python scripts/generate_recipes.py [--count N] [--catalog path/to/catalog.json|.jsonl]
+Recipes are generated lazily and streamed into the catalog, so memory use stays
+constant however large the catalog or --count is. JSON Lines catalogs are
+appended in place; JSON arrays are rewritten and swapped in atomically.
 """
-import json
+import argparse
 import random
+import sys
 from pathlib import Path
 
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+
+from scripts.build_neighbors import write_neighbor_table  # noqa: E402
+from src.catalog_io import append_recipes  # noqa: E402
+
+RPATH = BASE / "recipes.json"
+
 BASE_INGREDIENTS = [
     # Proteins
     "chicken", "beef", "pork", "tofu", "tempeh", "salmon", "tuna", "shrimp",
@@ -66,28 +78,28 @@ def make_recipe(i: int):
     }
 
 def main():
-    repo = Path(__file__).resolve().parents[1]
-    rpath = repo / "recipes.json"
+    parser = argparse.ArgumentParser(description="Append generated recipes to the catalog.")
+    parser.add_argument("--count", type=int, default=100, help="How many recipes to add (default: 100)")
+    parser.add_argument("--catalog", default=str(RPATH), help="Catalog to append to (default: recipes.json)")
+    args = parser.parse_args()
+
+    rpath = Path(args.catalog)
     if not rpath.exists():
-        print("recipes.json not found; aborting")
+        print(f"{rpath.name} not found; aborting")
         return
-    with open(rpath, "r", encoding="utf-8") as f:
-        try:
-            data = json.load(f)
-        except Exception as e:
-            print("Failed to read recipes.json:", e)
-            return
 
-    start = len(data) + 1
-    to_add = 100
-    for i in range(to_add):
-        rec = make_recipe(start + i)
-        data.append(rec)
+    new_recipes = (make_recipe(i + 1) for i in range(args.count))
+    try:
+        added = append_recipes(str(rpath), new_recipes)
+    except ValueError as e:
+        print(f"Failed to read {rpath.name}:", e)
+        return
 
-    with open(rpath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    if rpath.resolve() == RPATH.resolve():
+        # The similar-recipes table is keyed by the catalog's hash
+        write_neighbor_table(rpath)
 
-    print(f"Appended {to_add} recipes to {rpath}")
+    print(f"Appended {added} recipes to {rpath}")
 
 if __name__ == '__main__':
     main()
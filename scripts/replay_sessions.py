@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Replay scripted conversations against the CLI flow and report latencies.
+
+Each session runs the real `main.main()` conversation (diet prompt, ingredient
+parse, match, selection, explain, follow-ups, save) with `ask_user` and
+`ask_openai` replaced by stubs:
+- the user stub answers from a transcript after a simulated think time
+- the OpenAI stub returns a canned answer after a simulated model latency
+
+Sessions run concurrently in threads, each writing saved_recipes.json and
+saved_cards/ into its own temporary directory. Each directory starts with a
+copy of --saved-seed (the project's saved_recipes.json by default), so a save
+reads and rewrites a realistically sized list instead of an empty one. The
+report shows per-step latency distributions (time from the user's answer to
+the next prompt, so think time is excluded but model latency is included) and
+the file I/O volume of the save steps.
+
+Run: python3 scripts/replay_sessions.py [--sessions 200] [--concurrency 16]
+     python3 scripts/replay_sessions.py --transcripts my_transcripts.json --openai-latency-ms 800
+     python3 scripts/replay_sessions.py --saved-seed big_saved_list.json
+A transcripts file is a JSON list of {"name": ..., "inputs": [answer, ...]}.
+"""
+import argparse
+import io
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+
+import main as cli  # noqa: E402
+
+SAVED_PATH = BASE / "saved_recipes.json"
+
+DEFAULT_TRANSCRIPTS = [
+    {"name": "save_recipe", "inputs": ["", "chicken, rice, garlic", "1", "how long does it take?", "want to make this", "y", "exit"]},
+    {"name": "vegan_substitute", "inputs": ["vegan", "tofu, broccoli, garlic", "1", "I don't have butter", "steps", "exit"]},
+    {"name": "meal_plan", "inputs": ["", "chicken, rice, egg, onion, garlic", "2", "meal plan", "exit"]},
+    {"name": "free_form", "inputs": ["halal", "chicken, potato, carrot", "1", "can I make this spicier?", "what wine goes with it?", "exit"]},
+    {"name": "no_match_similar", "inputs": ["", "chicken, kale", "1", "want to make this", "n", "exit"]},
+    {"name": "quit_early", "inputs": ["", "pasta, tomato, garlic", "no"]},
+]
+
+# Prompt keyword -> step name
+PROMPT_STEPS = [
+    ("dietary preferences", "diet"),
+    ("ingredients do you have", "ingredients+match"),
+    ("which number", "select+explain"),
+    ("save this recipe", "save"),
+]
+
+
+def step_name(prompt, answer):
+    """Name the step that processes `answer` to `prompt`."""
+    p = prompt.lower()
+    for key, name in PROMPT_STEPS:
+        if key in p:
+            return name
+    # Same predicates as main.py's follow-up loop
+    return "follow_up:" + cli.follow_up_intent(answer)
+
+
+class _ThreadStdout(io.TextIOBase):
+    """sys.stdout stand-in that sends each session thread's output to its own buffer."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self, buf):
+        self._local.buf = buf
+
+    def write(self, text):
+        buf = getattr(self._local, "buf", None)
+        return (buf or self._fallback).write(text)
+
+    def flush(self):
+        pass
+
+
+def _file_state(root):
+    state = {}
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            state[path] = (st.st_mtime_ns, st.st_size)
+    return state
+
+
+def run_session(transcript, workdir, think_ms, openai_ms, jitter, rng):
+    """Replay one transcript.
+
+    Returns:
+        Dict with per-step latencies [(step, ms)], I/O byte counts, error text
+    """
+    inputs = list(transcript["inputs"])
+    steps = []
+    io_stats = {"saved_json_written": 0, "saved_json_read": 0, "cards_written": 0, "card_files": 0}
+    pending = {}  # the answer being processed: step name, start time, file state
+
+    def sleep(ms):
+        if ms > 0:
+            time.sleep(ms * rng.uniform(1 - jitter, 1 + jitter) / 1000)
+
+    def finish_step():
+        if not pending:
+            return
+        steps.append((pending["step"], (time.perf_counter() - pending["start"]) * 1000))
+        if pending["before"] is not None:
+            saved_json = os.path.join(workdir, "saved_recipes.json")
+            before = pending["before"]
+            for path, st in _file_state(workdir).items():
+                if before.get(path) == st:
+                    continue
+                if path == saved_json:
+                    io_stats["saved_json_written"] += st[1]
+                    # main.py reads the old list before rewriting it
+                    io_stats["saved_json_read"] += before.get(path, (0, 0))[1]
+                else:
+                    io_stats["cards_written"] += st[1]
+                    io_stats["card_files"] += 1
+        pending.clear()
+
+    def ask_user(prompt):
+        finish_step()
+        if not inputs:
+            raise EOFError
+        sleep(think_ms)
+        answer = inputs.pop(0)
+        step = step_name(prompt, answer)
+        pending.update(step=step, before=_file_state(workdir) if step == "save" else None,
+                       start=time.perf_counter())
+        return answer
+
+    def ask_openai(question, recipe):
+        sleep(openai_ms)
+        return f"(stub answer about {recipe.get('title')})"
+
+    error = None
+    try:
+        cli.main(ask_user=ask_user, ask_openai=ask_openai, base_dir=workdir)
+    except SystemExit:
+        pass
+    except EOFError:
+        error = "transcript ran out of inputs"
+    except Exception as e:  # report, don't crash the whole run
+        error = f"{type(e).__name__}: {e}"
+    finish_step()
+    return {"steps": steps, "io": io_stats, "error": error}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay CLI conversations and report per-step latency.")
+    parser.add_argument("--transcripts", help="JSON file of transcripts (default: built-in set)")
+    parser.add_argument("--sessions", type=int, default=200, help="Total sessions to run (default: 200)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Sessions run at once (default: 16)")
+    parser.add_argument("--think-ms", type=float, default=5.0, help="Simulated user think time per answer (default: 5)")
+    parser.add_argument("--openai-latency-ms", type=float, default=50.0, help="Simulated ask_openai latency (default: 50)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Random +/- fraction applied to simulated latencies (default: 0.2)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--saved-seed", default=str(SAVED_PATH) if SAVED_PATH.exists() else "",
+                        help="saved_recipes.json copied into each session before it starts; "
+                             "empty string to start with no saved list (default: the project's saved_recipes.json)")
+    args = parser.parse_args()
+
+    if args.transcripts:
+        with open(args.transcripts, "r", encoding="utf-8") as f:
+            transcripts = json.load(f)
+    else:
+        transcripts = DEFAULT_TRANSCRIPTS
+    seed_bytes = os.path.getsize(args.saved_seed) if args.saved_seed else 0
+
+    stdout = _ThreadStdout(sys.stdout)
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="replay-") as tmp:
+        def one(i):
+            transcript = transcripts[i % len(transcripts)]
+            workdir = os.path.join(tmp, f"session-{i}")
+            os.makedirs(workdir)
+            if args.saved_seed:
+                shutil.copyfile(args.saved_seed, os.path.join(workdir, "saved_recipes.json"))
+            stdout.capture(io.StringIO())
+            try:
+                result = run_session(transcript, workdir, args.think_ms, args.openai_latency_ms,
+                                     args.jitter, random.Random(args.seed + i))
+            finally:
+                stdout.capture(None)
+            result["name"] = transcript.get("name", f"transcript-{i % len(transcripts)}")
+            return result
+
+        real_stdout = sys.stdout
+        sys.stdout = stdout
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                results = list(pool.map(one, range(args.sessions)))
+        finally:
+            wall = time.perf_counter() - start
+            sys.stdout = real_stdout
+
+    by_step = {}
+    for r in results:
+        for step, ms in r["steps"]:
+            by_step.setdefault(step, []).append(ms)
+    errors = [r for r in results if r["error"]]
+
+    print(f"Replayed {len(results)} sessions ({len(transcripts)} transcript(s)) with concurrency {args.concurrency} "
+          f"in {wall:.2f}s ({len(results) / wall:.1f} sessions/s)")
+    print(f"Simulated latency: think {args.think_ms:.0f} ms, openai {args.openai_latency_ms:.0f} ms (+/-{args.jitter:.0%})")
+    print()
+    print(f"{'step':<24}{'count':>7}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for step in sorted(by_step):
+        values = sorted(by_step[step])
+        print(f"{step:<24}{len(values):>7}{percentile(values, 50):>10.2f}{percentile(values, 90):>10.2f}"
+              f"{percentile(values, 99):>10.2f}{values[-1]:>10.2f}")
+
+    totals = {}
+    for r in results:
+        for key, value in r["io"].items():
+            totals[key] = totals.get(key, 0) + value
+    print()
+    print(f"File I/O from saves (saved_recipes.json seeded with {seed_bytes} bytes per session):")
+    print(f" - saved_recipes.json: {totals.get('saved_json_written', 0)} bytes written, "
+          f"{totals.get('saved_json_read', 0)} bytes read")
+    print(f" - saved_cards/: {totals.get('card_files', 0)} file write(s), {totals.get('cards_written', 0)} bytes written")
+
+    if errors:
+        print()
+        print(f"{len(errors)} session(s) failed:")
+        for r in errors[:10]:
+            print(f" - {r['name']}: {r['error']}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
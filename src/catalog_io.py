@@ -0,0 +1,293 @@
+"""
+src/catalog_io.py
+=================
+Streaming, constant-memory read/write of recipe catalogs for maintenance scripts.
+
+This module provides:
+- iter_recipes(): incremental reader for a JSON array or JSON Lines catalog
+- write_recipes(): streaming writer that finishes with an atomic file swap
+- append_recipes(): add recipes without loading the existing catalog
+
+The format is picked from the file extension: ".jsonl" means JSON Lines (one
+recipe per line), anything else is a JSON array written in the same
+indent=2 layout as json.dump(data, indent=2), so diffs stay small.
+
+Crash safety: rewrites always go through a temp file + os.replace(). JSON
+Lines appends are done in place (that is what keeps them cheap), so a crash
+can leave a partial last line. The reader skips an unparsable last line that
+has no trailing newline, and the next append truncates it before writing
+(a complete last line that only lacks its newline is kept).
+"""
+import hashlib
+import json
+import os
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator
+
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+_NUMBER_CHARS = "0123456789+-.eE"
+# Longest partial token that still decodes with an error near the buffer end
+# (e.g. "tru" of "true", a cut "\\u12" escape)
+_MAX_TOKEN_PREFIX = 6
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 hex digest of a file, used to tie derived indexes to a catalog."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def default_file_mode() -> int:
+    """Mode a plain open(path, "w") would give a new file (0o666 minus the umask)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def is_jsonl(path: str) -> bool:
+    """True if the catalog at `path` uses JSON Lines."""
+    return str(path).endswith(".jsonl")
+
+
+def _iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # A last line without its newline is an interrupted append
+                if not line.endswith("\n"):
+                    return
+                raise
+
+
+def _repair_last_line(f) -> None:
+    """Make a JSON Lines file (binary, opened for update) end with a newline.
+
+    A complete last line that only lacks its newline gets one; an unparsable
+    partial line left by an interrupted append is truncated away.
+    """
+    end = f.seek(0, os.SEEK_END)
+    pos = end
+    start = 0
+    while pos > 0:
+        step = min(CHUNK_SIZE, pos)
+        f.seek(pos - step)
+        chunk = f.read(step)
+        if pos == end and chunk.endswith(b"\n"):
+            return
+        nl = chunk.rfind(b"\n")
+        if nl != -1:
+            start = pos - step + nl + 1
+            break
+        pos -= step
+    if start == end:
+        return
+    f.seek(start)
+    try:
+        json.loads(f.read().decode("utf-8"))
+    except ValueError:
+        f.truncate(start)
+    else:
+        f.seek(0, os.SEEK_END)
+        f.write(b"\n")
+
+
+def _needs_more(buf: str, item: Any, end: int) -> bool:
+    """True if a value decoded at the end of the buffer might continue in the next chunk."""
+    if end == len(buf):
+        return True
+    # A number stops at the first character it can't use, so "1." from a
+    # split "1.5e3" decodes as 1; wait until a non-number character follows.
+    if isinstance(item, (int, float)) and not isinstance(item, bool):
+        return not buf[end:].strip(_NUMBER_CHARS)
+    return False
+
+
+def _iter_json_array(path: str, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        consumed = 0  # characters dropped from the front of buf so far
+        eof = False
+
+        def fill():
+            # Drop consumed text and read the next chunk; False at end of file
+            nonlocal buf, pos, consumed, eof
+            chunk = f.read(chunk_size)
+            consumed += pos
+            buf = buf[pos:] + chunk
+            pos = 0
+            eof = not chunk
+            return not eof
+
+        def skip_ws():
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buf) or not fill():
+                    return
+
+        skip_ws()
+        if pos >= len(buf) or buf[pos] != "[":
+            raise ValueError(f"{path}: expected a JSON array")
+        pos += 1
+        skip_ws()
+        if pos < len(buf) and buf[pos] == "]":
+            return
+
+        while True:
+            skip_ws()
+            try:
+                item, end = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError as e:
+                # Only an error at the very end of the buffer (or inside a
+                # string still being read) can be fixed by reading more; any
+                # other error is a real syntax error, reported right away so
+                # a bad file is never pulled into memory.
+                unterminated = e.msg.startswith("Unterminated string")
+                if not eof and (unterminated or e.pos >= len(buf) - _MAX_TOKEN_PREFIX):
+                    fill()
+                    continue
+                if unterminated or e.pos >= len(buf):
+                    raise ValueError(f"{path}: truncated JSON array")
+                raise ValueError(f"{path}: invalid JSON at character {consumed + e.pos}: {e.msg}") from e
+            if not eof and _needs_more(buf, item, end):
+                fill()
+                continue
+            yield item
+            pos = end
+            skip_ws()
+            if pos >= len(buf):
+                raise ValueError(f"{path}: truncated JSON array")
+            if buf[pos] == ",":
+                pos += 1
+            elif buf[pos] == "]":
+                return
+            else:
+                raise ValueError(f"{path}: expected ',' or ']' at character {consumed + pos} in JSON array")
+
+
+def iter_recipes(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield recipes from a catalog one at a time.
+
+    Only one recipe (plus one read chunk) is held in memory, whatever the
+    catalog size.
+
+    Args:
+        path: Catalog path (.json array or .jsonl)
+        chunk_size: Characters read per chunk for JSON arrays
+
+    Returns:
+        Iterator of recipe dicts, in file order
+
+    Raises:
+        ValueError: If the file is not a well-formed JSON array / JSON Lines;
+            syntax errors are reported with their character offset as soon
+            as they are reached
+    """
+    if is_jsonl(path):
+        return _iter_jsonl(path)
+    return _iter_json_array(path, chunk_size)
+
+
+def write_recipes(path: str, recipes: Iterable[Dict[str, Any]], ensure_ascii: bool = False) -> int:
+    """Stream recipes to `path`, replacing it atomically.
+
+    Recipes are written to a temporary file in the same directory which is
+    swapped in with os.replace() only after everything has been written, so
+    readers never see a half-written catalog. `recipes` may be a generator
+    reading from `path` itself.
+
+    Args:
+        path: Destination catalog path (.json array or .jsonl)
+        recipes: Iterable of recipe dicts
+        ensure_ascii: Escape non-ASCII characters (default: False)
+
+    Returns:
+        Number of recipes written
+    """
+    # Imported here so reading catalogs (and CLI startup) doesn't pay for them
+    import tempfile
+    import textwrap
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".catalog-", suffix=".tmp", dir=directory)
+    count = 0
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            if is_jsonl(path):
+                for r in recipes:
+                    f.write(json.dumps(r, ensure_ascii=ensure_ascii) + "\n")
+                    count += 1
+            else:
+                f.write("[")
+                for r in recipes:
+                    f.write(",\n  " if count else "\n  ")
+                    f.write(textwrap.indent(json.dumps(r, indent=2, ensure_ascii=ensure_ascii), "  ")[2:])
+                    count += 1
+                f.write("\n]" if count else "]")
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600 files: keep the original file's permissions,
+        # or use the normal umask-derived mode for a new catalog
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        else:
+            os.chmod(tmp_path, default_file_mode())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
+
+
+def append_recipes(path: str, new_recipes: Iterable[Dict[str, Any]], ensure_ascii: bool = False) -> int:
+    """Append recipes to a catalog without loading it into memory.
+
+    JSON Lines catalogs are appended in place (not atomic): an unparsable
+    partial last line left by an earlier crashed append is truncated first
+    (a complete one just gets its missing newline), and the new
+    lines are fsynced before returning. JSON arrays are streamed into a new
+    file (existing recipes, then the new ones) and swapped in atomically.
+
+    Args:
+        path: Catalog path (.json array or .jsonl)
+        new_recipes: Iterable of recipe dicts to add
+        ensure_ascii: Escape non-ASCII characters (default: False)
+
+    Returns:
+        Number of recipes appended
+    """
+    if is_jsonl(path):
+        count = 0
+        with open(path, "ab+") as f:
+            _repair_last_line(f)
+            f.seek(0, os.SEEK_END)
+            for r in new_recipes:
+                f.write((json.dumps(r, ensure_ascii=ensure_ascii) + "\n").encode("utf-8"))
+                count += 1
+            f.flush()
+            os.fsync(f.fileno())
+        return count
+
+    added = [0]
+
+    def counted():
+        for r in new_recipes:
+            added[0] += 1
+            yield r
+
+    existing = iter_recipes(path) if os.path.exists(path) else iter(())
+    write_recipes(path, chain(existing, counted()), ensure_ascii=ensure_ascii)
+    return added[0]
@@ -0,0 +1,162 @@
+"""
+src/meal_plan.py
+================
+Meal-plan solver: pick N recipes that make the most of the user's pantry.
+
+This module provides:
+- plan_meals(): choose N recipes from match_recipes() candidates that use as
+  much of the pantry as possible while adding as few missing ingredients as
+  possible, and return one merged, deduplicated shopping list
+
+Ingredient sets are encoded as integer bitsets (one bit per distinct recipe
+ingredient), so scoring a candidate is a couple of AND/NOT operations and a
+popcount instead of list scans. Selection is greedy by default; pass
+beam_width > 1 for a bounded beam search that keeps the best few partial plans.
+"""
+import heapq
+from typing import Any, Dict, List, Tuple
+
+from src.recipe_helper import match_recipes, normalize
+
+
+def _popcount(x: int) -> int:
+    return bin(x).count("1")
+
+
+# int.bit_count() is much faster where available (Python 3.10+)
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count  # noqa: F811
+
+
+def _bits(mask: int) -> List[int]:
+    """Positions of the set bits in mask, lowest first."""
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(low.bit_length() - 1)
+        mask ^= low
+    return out
+
+
+def _encode(candidates: List[Dict[str, Any]], pantry: List[str]) -> Tuple[List[str], List[int], int]:
+    """Encode candidate ingredient lists and the pantry as bitsets.
+
+    Returns:
+        (ingredient names by bit, recipe masks aligned with candidates, pantry mask)
+    """
+    bits = {}
+    names = []
+    masks = []
+    for r in candidates:
+        mask = 0
+        for ing in r.get("ingredients", []):
+            key = normalize(ing)
+            if key not in bits:
+                bits[key] = len(names)
+                names.append(key)
+            mask |= 1 << bits[key]
+        masks.append(mask)
+
+    # Exact normalized match, like the single-recipe shopping list in main.py.
+    # (match_recipes' looser substring rule only picks the candidates: "egg"
+    # must not count as having "eggplant" when building a shopping list.)
+    pantry_mask = 0
+    for u in set(normalize(i) for i in pantry):
+        if u in bits:
+            pantry_mask |= 1 << bits[u]
+    return names, masks, pantry_mask
+
+
+def plan_meals(ingredients: List[str], n: int = 7, diet: str = None,
+               candidates: List[Tuple[Dict[str, Any], int]] = None,
+               min_match: int = 1, beam_width: int = 1) -> Dict[str, Any]:
+    """Pick up to n recipes that maximize pantry use and minimize shopping.
+
+    Each step adds the recipe with the best marginal gain: pantry ingredients
+    not yet used by the plan, minus ingredients not already on the shopping
+    list. Recipes with identical ingredient sets count as one meal.
+
+    Args:
+        ingredients: List of user (pantry) ingredients
+        n: Number of recipes to plan (default: 7, one week of dinners)
+        diet: Optional dietary filter string (e.g., "vegan", "halal")
+        candidates: Optional (recipe_dict, match_count) tuples, e.g. from
+            match_recipes(); defaults to match_recipes(ingredients, min_match, diet)
+        min_match: Minimum matches when candidates are looked up (default: 1)
+        beam_width: Partial plans kept per step; 1 = greedy (default: 1)
+
+    Returns:
+        Dict with:
+        - "recipes": chosen recipe dicts, in pick order
+        - "pantry_used": the user's pantry ingredients the plan uses, in
+          the order they were given
+        - "shopping_list": merged missing ingredients, in first-needed order
+    """
+    if candidates is None:
+        candidates = match_recipes(ingredients, min_match=min_match, diet=diet)
+    pool = [r for r, _ in candidates]
+
+    names, masks, pantry_mask = _encode(pool, ingredients)
+
+    # Drop candidates whose ingredient set duplicates an earlier one
+    seen = set()
+    unique = []
+    for idx, mask in enumerate(masks):
+        if mask not in seen:
+            seen.add(mask)
+            unique.append(idx)
+
+    unique_masks = [masks[idx] for idx in unique]
+
+    # A plan is (score, used pantry mask, shopping mask, picked positions in unique)
+    beam = [(0, 0, 0, ())]
+    for _ in range(min(n, len(unique))):
+        expanded = []
+        for score, used, shopping, picked in beam:
+            free = pantry_mask & ~used
+            cost = ~pantry_mask & ~shopping
+            gains = [_popcount(m & free) - _popcount(m & cost) for m in unique_masks]
+            for pos in picked:
+                gains[pos] = None
+            # Only the best few children of each plan can survive the cut;
+            # ties go to recipes that rank higher in the candidate list
+            best = heapq.nsmallest(beam_width, (pos for pos in range(len(gains)) if gains[pos] is not None),
+                                   key=lambda pos: (-gains[pos], pos))
+            for pos in best:
+                m = unique_masks[pos]
+                expanded.append((score + gains[pos], used | (m & pantry_mask), shopping | (m & ~pantry_mask), picked + (pos,)))
+        expanded.sort(key=lambda p: (-p[0], p[3]))
+        beam = []
+        kept = set()
+        for plan in expanded:
+            key = frozenset(plan[3])
+            if key not in kept:
+                kept.add(key)
+                beam.append(plan)
+                if len(beam) >= beam_width:
+                    break
+
+    _, used, shopping, picked = beam[0]
+    picked = [unique[pos] for pos in picked]
+    chosen = [pool[idx] for idx in picked]
+
+    # Merge missing ingredients in the order the picked recipes need them
+    shopping_list = []
+    listed = 0
+    for idx in picked:
+        for bit in _bits(masks[idx] & shopping & ~listed):
+            shopping_list.append(names[bit])
+        listed |= masks[idx] & shopping
+
+    used_names = set(names[bit] for bit in _bits(used))
+    pantry_used = []
+    for i in ingredients:
+        key = normalize(i)
+        if key in used_names and key not in pantry_used:
+            pantry_used.append(key)
+
+    return {
+        "recipes": chosen,
+        "pantry_used": pantry_used,
+        "shopping_list": shopping_list,
+    }
@@ -5,14 +5,27 @@ This module provides a single function `ask_openai(question, recipe, system_prom
 returns a string answer or raises an exception on failure. If the environment variable
 `OPENAI_API_KEY` is not set, the function returns None so callers can fall back to offline
 behaviour.
+
+The `openai` SDK is imported lazily on the first call that has an API key, so CLI startup
+(and offline runs) never pay for importing it.
 """
 import os
 from typing import Optional, Dict, Any
 
-try:
-    import openai
-except Exception:
-    openai = None
+# Cached SDK module: None = not imported yet, False = not installed
+_openai = None
+
+
+def _get_openai():
+    """Import the optional OpenAI SDK on first use; None if it isn't installed."""
+    global _openai
+    if _openai is None:
+        try:
+            import openai
+            _openai = openai
+        except Exception:
+            _openai = False
+    return _openai or None
 
 
 def ask_openai(question: str, recipe: Dict[str, Any], system_prompt: Optional[str] = None, model: str = "gpt-4o-mini") -> Optional[str]:
@@ -28,7 +41,10 @@ def ask_openai(question: str, recipe: Dict[str, Any], system_prompt: Optional[st
         Answer text when successful, or None when API key/library is missing or on error.
     """
     api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or openai is None:
+    if not api_key:
+        return None
+    openai = _get_openai()
+    if openai is None:
         return None
 
     openai.api_key = api_key
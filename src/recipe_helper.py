@@ -10,19 +10,39 @@ This module provides:
 - Recipe display formatting
 - Ingredient substitution suggestions
 - Recipe lookup by index or title
+- Cooking-time filtering via a sorted minutes index
+- "Similar recipes" lookups from a precomputed neighbour table
 
-The recipe database is loaded from recipes.json on module import.
+The recipe database is loaded from recipes.json on module import. The parsed,
+normalized and indexed catalog is cached in a pickle snapshot
+(recipes.snapshot) keyed by the SHA-256 of recipes.json and of this module,
+so later starts skip JSON parsing and index building; editing either one
+invalidates it.
 """
+import bisect
 import json
 import os
-from typing import List, Dict, Any, Tuple
+import pickle
+import re
+import sys
+from typing import List, Dict, Any, Tuple, Optional
 
-# Load recipe database from JSON file in project root
+from src.catalog_io import default_file_mode, file_digest
+
+# Recipe database (JSON) in project root
 BASE = os.path.dirname(os.path.dirname(__file__))
 RECIPES_PATH = os.path.join(BASE, "recipes.json")
-
-with open(RECIPES_PATH, "r", encoding="utf-8") as f:
-    RECIPES = json.load(f)
+# Built offline by scripts/build_neighbors.py
+NEIGHBORS_PATH = os.path.join(BASE, "recipes_neighbors.json")
+# Rebuilt automatically whenever recipes.json changes; RECIPES_SNAPSHOT_PATH
+# moves it (e.g. so tests don't write into the checkout)
+SNAPSHOT_PATH = os.environ.get("RECIPES_SNAPSHOT_PATH") or os.path.join(BASE, "recipes.snapshot")
+SNAPSHOT_VERSION = 1
+# The snapshot stores the output of normalize(), parse_minutes(),
+# _build_time_index() and _build_catalog(). It is also keyed by the hash of
+# this file, so editing any of them rebuilds it; bump SNAPSHOT_VERSION too if
+# the change lives elsewhere (e.g. a helper these call from another module).
+CODE_DIGEST = file_digest(__file__)
 
 
 def normalize(text: str) -> str:
@@ -37,6 +57,130 @@ def normalize(text: str) -> str:
     return text.lower().strip()
 
 
+def parse_minutes(time_text: str) -> Optional[int]:
+    """Parse a free-text recipe time into whole minutes.
+
+    Handles:
+    - "25 minutes" -> 25
+    - "1 hour" / "1 hr 15 min" / "1h30m" -> 60 / 75 / 90
+    - "1.5 hours" -> 90 (decimal hours)
+    - "1 hour 30" -> 90 (a bare number after the hours counts as minutes,
+      but "1 hour 30 seconds" -> 60)
+    - "5 min prep + 20 min cook" -> 25 (several amounts are added up)
+
+    Args:
+        time_text: Recipe time string (e.g., "25 minutes")
+
+    Returns:
+        Total minutes, or None if no number could be found
+    """
+    text = normalize(time_text or "")
+    hours = list(re.finditer(r"(\d+(?:\.\d+)?)\s*(?:hours?|hrs?|h)(?![a-z])", text))
+    mins = [int(m) for m in re.findall(r"(\d+)\s*(?:minutes?|mins?|m)(?![a-z])", text)]
+    if hours and not mins:
+        # "1 hour 30" / "1 hr and 30": trailing number without a unit of its own
+        trailing = re.match(r"\s*(?:and\s+)?(\d+)(?![\d.]|\s*[a-z])", text[hours[-1].end():])
+        if trailing:
+            mins = [int(trailing.group(1))]
+    if hours or mins:
+        return sum(round(float(h.group(1)) * 60) for h in hours) + sum(mins)
+    # Bare number (e.g. "25") is treated as minutes
+    m = re.search(r"(\d+)", text)
+    return int(m.group(1)) if m else None
+
+
+def _build_time_index(recipes: List[Dict[str, Any]]) -> Tuple[List[int], List[int]]:
+    """Store integer minutes on each recipe and build a sorted time index.
+
+    Recipes whose time can't be parsed get `minutes = None` and are left out
+    of the index (so time filters never match them).
+
+    Returns:
+        (sorted minute keys, recipe positions in RECIPES aligned with the keys)
+    """
+    pairs = []
+    for pos, r in enumerate(recipes):
+        minutes = parse_minutes(r.get("time", ""))
+        r["minutes"] = minutes
+        if minutes is not None:
+            pairs.append((minutes, pos))
+    pairs.sort()
+    return [m for m, _ in pairs], [pos for _, pos in pairs]
+
+
+def _build_catalog(recipes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Normalize and index a freshly parsed recipe list."""
+    time_keys, time_positions = _build_time_index(recipes)
+    diets = set()
+    for r in recipes:
+        diets.update(r.get("diets", []))
+    return {
+        "version": SNAPSHOT_VERSION,
+        "recipes": recipes,
+        "time_keys": time_keys,
+        "time_positions": time_positions,
+        "ingredients": [[normalize(i) for i in r.get("ingredients", [])] for r in recipes],
+        "diets": sorted(diets),
+    }
+
+
+def _write_snapshot(catalog: Dict[str, Any], snapshot_path: str) -> None:
+    """Best-effort atomic write of the catalog snapshot (skipped if not writable)."""
+    import tempfile
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=".snapshot-", dir=os.path.dirname(snapshot_path))
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp_path, default_file_mode())
+        os.replace(tmp_path, snapshot_path)
+    except OSError:
+        pass
+
+
+def load_catalog(path: str = RECIPES_PATH, snapshot_path: str = SNAPSHOT_PATH) -> Dict[str, Any]:
+    """Load the indexed recipe catalog, preferring a valid snapshot.
+
+    The snapshot is used only if its version and recorded hashes match the
+    current recipes.json and this module's code; otherwise the JSON is parsed, indexed and a new
+    snapshot is written for next time.
+
+    Args:
+        path: Recipe catalog (JSON array)
+        snapshot_path: Pickle snapshot location
+
+    Returns:
+        Dict with recipes, time index, normalized ingredients, diets and
+        source_sha256
+    """
+    digest = file_digest(path)
+    try:
+        with open(snapshot_path, "rb") as f:
+            catalog = pickle.load(f)
+        if (catalog.get("version") == SNAPSHOT_VERSION and catalog.get("source_sha256") == digest
+                and catalog.get("code_sha256") == CODE_DIGEST):
+            return catalog
+    except Exception:
+        # Missing, unreadable or from an incompatible version: rebuild
+        pass
+
+    with open(path, "r", encoding="utf-8") as f:
+        catalog = _build_catalog(json.load(f))
+    catalog["source_sha256"] = digest
+    catalog["code_sha256"] = CODE_DIGEST
+    _write_snapshot(catalog, snapshot_path)
+    return catalog
+
+
+_CATALOG = load_catalog()
+CATALOG_DIGEST = _CATALOG["source_sha256"]
+RECIPES = _CATALOG["recipes"]
+# Normalized ingredient lists, aligned with RECIPES
+NORMALIZED_INGREDIENTS = _CATALOG["ingredients"]
+# Sorted (minutes -> recipe position) index used for "ready in N minutes" queries
+TIME_KEYS, TIME_POSITIONS = _CATALOG["time_keys"], _CATALOG["time_positions"]
+
+
 def parse_ingredients(text: str) -> List[str]:
     """Parse comma or semicolon-separated ingredient input into normalized list.
     
@@ -65,19 +209,46 @@ def parse_ingredients(text: str) -> List[str]:
     return normalized
 
 
-def match_recipes(ingredients: List[str], min_match: int = 2, diet: str = None) -> List[Tuple[Dict[str, Any], int]]:
+def recipes_within_time(min_minutes: Optional[int] = None, max_minutes: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Get recipes whose total time falls within [min_minutes, max_minutes].
+
+    Uses bisection on the sorted time index, so the cost is proportional to
+    the number of recipes returned rather than the catalog size.
+
+    Args:
+        min_minutes: Optional lower bound (inclusive)
+        max_minutes: Optional upper bound (inclusive)
+
+    Returns:
+        Recipes in catalog order
+    """
+    return [RECIPES[pos] for pos in _positions_within_time(min_minutes, max_minutes)]
+
+
+def _positions_within_time(min_minutes: Optional[int], max_minutes: Optional[int]) -> List[int]:
+    lo = 0 if min_minutes is None else bisect.bisect_left(TIME_KEYS, min_minutes)
+    hi = len(TIME_KEYS) if max_minutes is None else bisect.bisect_right(TIME_KEYS, max_minutes)
+    # Keep catalog order so ties sort the same way as an unfiltered scan
+    return sorted(TIME_POSITIONS[lo:hi])
+
+
+def match_recipes(ingredients: List[str], min_match: int = 2, diet: str = None,
+                  max_minutes: Optional[int] = None, min_minutes: Optional[int] = None) -> List[Tuple[Dict[str, Any], int]]:
     """Find recipes matching user ingredients with optional dietary filtering.
     
     Algorithm:
-    1. Filter recipes by diet (if specified)
-    2. Count matching ingredients per recipe (intersection of ingredient sets)
-    3. Keep only recipes with >= min_match matching ingredients
-    4. Sort by match count (descending) then title (ascending)
+    1. Narrow to recipes within the time range (if specified) via the time index
+    2. Filter recipes by diet (if specified)
+    3. Count matching ingredients per recipe (intersection of ingredient sets)
+    4. Keep only recipes with >= min_match matching ingredients
+    5. Sort by match count (descending) then title (ascending)
     
     Args:
         ingredients: List of user ingredients
         min_match: Minimum required ingredient matches (default: 2)
         diet: Optional dietary filter string (e.g., "vegan", "halal")
+        max_minutes: Optional maximum total time in minutes (inclusive)
+        min_minutes: Optional minimum total time in minutes (inclusive)
         
     Returns:
         List of (recipe_dict, match_count) tuples, sorted by best matches
@@ -85,16 +256,22 @@ def match_recipes(ingredients: List[str], min_match: int = 2, diet: str = None)
     # Normalize user-provided ingredients
     ing_set = set([normalize(i) for i in ingredients])
     matches = []
+
+    if max_minutes is None and min_minutes is None:
+        positions = range(len(RECIPES))
+    else:
+        positions = _positions_within_time(min_minutes, max_minutes)
     
-    for r in RECIPES:
+    for pos in positions:
+        r = RECIPES[pos]
         # Apply dietary filter if specified
         if diet:
             diets = [normalize(d) for d in r.get("diets", [])]
             if normalize(diet) not in diets:
                 continue  # Skip recipes that don't match user's diet
         
-        # Count ingredient overlap
-        recipe_ings_list = [normalize(i) for i in r.get("ingredients", [])]
+        # Count ingredient overlap (ingredients are normalized at load time)
+        recipe_ings_list = NORMALIZED_INGREDIENTS[pos]
 
         # Allow substring and exact matches: e.g., user 'soba' matches 'soba noodles'
         matched = set()
@@ -207,8 +384,136 @@ def get_available_diets() -> List[str]:
     Returns:
         Sorted list of unique diet tags (e.g., ["halal", "kosher", "vegan", ...])
     """
-    diets = set()
-    for r in RECIPES:
-        diets.update(r.get("diets", []))
-    return sorted(list(diets))
+    return list(_CATALOG["diets"])
+
+
+# Lazily loaded "similar recipes" table: neighbour rows aligned with RECIPES,
+# plus lookup structures used to anchor a pantry on catalog recipes.
+_NEIGHBORS = None
+
+
+def _load_neighbors() -> Dict[str, Any]:
+    """Load the neighbour table once; an empty table if missing or stale."""
+    global _NEIGHBORS
+    if _NEIGHBORS is not None:
+        return _NEIGHBORS
+
+    rows = []
+    try:
+        with open(NEIGHBORS_PATH, "r", encoding="utf-8") as f:
+            table = json.load(f)
+        if table.get("count") == len(RECIPES) and table.get("source_sha256") == CATALOG_DIGEST:
+            rows = table.get("neighbors", [])
+        else:
+            print(f"Warning: {os.path.basename(NEIGHBORS_PATH)} was built for a different recipes.json; "
+                  "similar-recipe suggestions are off until scripts/build_neighbors.py is re-run.",
+                  file=sys.stderr)
+    except FileNotFoundError:
+        rows = []
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not read {os.path.basename(NEIGHBORS_PATH)} ({e}); "
+              "similar-recipe suggestions are off.", file=sys.stderr)
+        rows = []
+
+    by_ingredient = {}
+    for pos, ings in enumerate(NORMALIZED_INGREDIENTS):
+        for ing in ings:
+            by_ingredient.setdefault(ing, set()).add(pos)
+
+    by_title = {}
+    for pos, r in enumerate(RECIPES):
+        by_title.setdefault(normalize(r.get("title", "")), []).append(pos)
+
+    _NEIGHBORS = {
+        "rows": rows,
+        "positions": {id(r): pos for pos, r in enumerate(RECIPES)},
+        "by_ingredient": by_ingredient,
+        "by_title": by_title,
+    }
+    return _NEIGHBORS
+
+
+def _recipe_position(table: Dict[str, Any], recipe: Any) -> Optional[int]:
+    """Resolve a recipe dict, catalog position or title to a RECIPES position."""
+    if isinstance(recipe, int):
+        return recipe if 0 <= recipe < len(RECIPES) else None
+    if isinstance(recipe, str):
+        positions = table["by_title"].get(normalize(recipe))
+        return positions[0] if positions else None
+    pos = table["positions"].get(id(recipe))
+    if pos is not None:
+        return pos
+    # A copy of a catalog recipe: match by title, preferring an equal recipe
+    positions = table["by_title"].get(normalize(recipe.get("title", "")), [])
+    for pos in positions:
+        if all(RECIPES[pos].get(key) == value for key, value in recipe.items()):
+            return pos
+    return positions[0] if positions else None
+
+
+def similar_recipes(recipe: Any = None, ingredients: List[str] = None,
+                    k: int = 3, diet: str = None) -> List[Tuple[Dict[str, Any], float]]:
+    """Find the closest recipes to a selected recipe or to a pantry.
+
+    Similarity comes from the precomputed neighbour table
+    (scripts/build_neighbors.py), so nothing is recomputed at query time:
+    - recipe: returns its stored neighbours
+    - ingredients: anchors the pantry on the recipes (within the diet, if
+      given) sharing the most ingredients with it, then adds those recipes'
+      neighbours
+
+    Args:
+        recipe: A recipe dict (from RECIPES or a copy of one), a 0-based
+            catalog position, or a recipe title
+        ingredients: List of user ingredients (used when recipe is None)
+        k: Maximum number of results (default: 3)
+        diet: Optional dietary filter string (e.g., "vegan", "halal")
+
+    Returns:
+        List of (recipe_dict, similarity) tuples, best first. Empty when the
+        neighbour table is missing/stale or nothing is related.
+    """
+    table = _load_neighbors()
+    rows = table["rows"]
+    if not rows:
+        return []
+
+    def fits_diet(pos):
+        return not diet or normalize(diet) in [normalize(d) for d in RECIPES[pos].get("diets", [])]
+
+    scores = {}
+    if recipe is not None:
+        pos = _recipe_position(table, recipe)
+        if pos is None:
+            return []
+        for j, score in rows[pos]:
+            scores[j] = score
+    else:
+        ing_set = set(normalize(i) for i in ingredients or [])
+        if not ing_set:
+            return []
+        # Same substring rule as match_recipes, applied to the ingredient
+        # vocabulary rather than to every recipe
+        overlap = {}
+        for ri, positions in table["by_ingredient"].items():
+            if any(u == ri or u in ri or ri in u for u in ing_set):
+                for pos in positions:
+                    overlap[pos] = overlap.get(pos, 0) + 1
+        # Anchor on recipes the user may eat, so diet users get neighbours
+        # of recipes in their diet rather than of the best overall matches
+        anchors = sorted((p for p in overlap if fits_diet(p)), key=lambda p: (-overlap[p], p))[:k]
+        for pos in anchors:
+            # Anchor score: share of the recipe's ingredients the user has
+            anchor_score = overlap[pos] / max(1, len(RECIPES[pos].get("ingredients", [])))
+            scores[pos] = max(scores.get(pos, 0.0), anchor_score)
+            for j, score in rows[pos]:
+                scores[j] = max(scores.get(j, 0.0), anchor_score * score)
 
+    results = []
+    for j in sorted(scores, key=lambda p: (-scores[p], p)):
+        if not fits_diet(j):
+            continue
+        results.append((RECIPES[j], round(scores[j], 3)))
+        if len(results) >= k:
+            break
+    return results
@@ -0,0 +1,109 @@
+"""
+src/similarity.py
+=================
+MinHash signatures and locality-sensitive hashing (LSH) for recipe similarity.
+
+This module provides:
+- Recipe tokenization (ingredients + title words)
+- MinHash signatures that estimate Jaccard similarity between token sets
+- LSH band keys so similar recipes land in the same bucket without
+  comparing every pair of recipes
+
+Used by offline maintenance scripts (scripts/dedup_recipes.py,
+scripts/build_neighbors.py). It does not load the recipe catalog itself, so
+importing it is cheap.
+"""
+import hashlib
+import random
+import re
+from functools import lru_cache
+from typing import AbstractSet, Any, Dict, List, Optional, Set, Tuple
+
+# Defaults: 64 permutations split into 16 bands of 4 rows. Pairs with a
+# Jaccard similarity around (1/16) ** (1/4) ~= 0.5 or higher are likely to
+# share at least one band bucket.
+NUM_PERM = 64
+NUM_BANDS = 16
+
+_PRIME = (1 << 61) - 1
+_MASK32 = 0xFFFFFFFF
+
+
+def _permutations(num_perm: int, seed: int = 1) -> List[Tuple[int, int]]:
+    rng = random.Random(seed)
+    return [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+
+_PERMS = _permutations(NUM_PERM)
+
+
+def recipe_tokens(recipe: Dict[str, Any], include_title: bool = True) -> Set[str]:
+    """Build the token set used for similarity from a recipe.
+
+    Ingredients and title words are prefixed ("i:" / "t:") so that e.g. the
+    ingredient "rice" and the title word "rice" count as different tokens.
+
+    Args:
+        recipe: Recipe dictionary with title and ingredients
+        include_title: Also add title words (default: True)
+
+    Returns:
+        Set of tokens
+    """
+    tokens = {"i:" + i.lower().strip() for i in recipe.get("ingredients", []) if i.strip()}
+    if include_title:
+        for word in re.findall(r"[0-9a-z]+", recipe.get("title", "").lower()):
+            tokens.add("t:" + word)
+    return tokens
+
+
+@lru_cache(maxsize=65536)
+def _token_vector(token: str) -> Tuple[int, ...]:
+    # Hash each token once, then apply every permutation. Recipe vocabularies
+    # are small, so caching these vectors makes signatures cheap to build.
+    h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+    return tuple(((a * h + b) % _PRIME) & _MASK32 for a, b in _PERMS)
+
+
+def minhash_signature(tokens: Set[str]) -> Optional[Tuple[int, ...]]:
+    """Compute a MinHash signature (NUM_PERM 32-bit values) for a token set.
+
+    Args:
+        tokens: Token set (see recipe_tokens)
+
+    Returns:
+        Signature tuple, or None for an empty token set
+    """
+    if not tokens:
+        return None
+    vectors = [_token_vector(t) for t in tokens]
+    if len(vectors) == 1:
+        return vectors[0]
+    return tuple(map(min, *vectors))
+
+
+def band_keys(signature: Tuple[int, ...], bands: int = NUM_BANDS) -> List[int]:
+    """Split a signature into LSH bands and hash each band to a bucket key.
+
+    Args:
+        signature: MinHash signature
+        bands: Number of bands (must divide the signature length)
+
+    Returns:
+        One bucket key per band
+    """
+    rows = len(signature) // bands
+    return [hash(signature[b * rows:(b + 1) * rows]) for b in range(bands)]
+
+
+def estimate_similarity(sig_a, sig_b) -> float:
+    """Estimate Jaccard similarity as the fraction of equal signature slots."""
+    same = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+    return same / len(sig_a) if len(sig_a) else 0.0
+
+
+def jaccard(a: AbstractSet, b: AbstractSet) -> float:
+    """Exact Jaccard similarity of two sets (0.0 when both are empty)."""
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
@@ -0,0 +1,11 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+
+# Importing src.recipe_helper writes the catalog snapshot; keep it out of the checkout
+_SNAPSHOT_DIR = tempfile.TemporaryDirectory(prefix="recipes-tests-")
+os.environ.setdefault("RECIPES_SNAPSHOT_PATH", os.path.join(_SNAPSHOT_DIR.name, "recipes.snapshot"))
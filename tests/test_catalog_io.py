@@ -0,0 +1,162 @@
+"""
+tests/test_catalog_io.py
+========================
+Streaming catalog reader/writer: chunk-boundary splits, truncated and
+invalid input, JSON Lines partial-line recovery and atomic rewrites.
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.catalog_io import append_recipes, default_file_mode, iter_recipes, write_recipes
+
+BASE = Path(__file__).resolve().parents[1]
+
+# Exercises every kind of token the incremental reader can see cut in half
+SAMPLE = [
+    {"title": "Crème brûlée — \"classic\"", "ingredients": ["cream", "sugar"], "time": "1h30m",
+     "ratio": 1.5e3, "neg": -0.25, "n": 12345, "ok": True, "bad": False, "none": None,
+     "escaped": "tab\there \\ slash é", "nested": {"a": [1, [2, {"b": []}]], "c": {}}},
+    {"title": "Toast", "ingredients": [], "steps": [], "minutes": 5},
+    {},
+]
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def sample_text():
+    return json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+
+def test_every_chunk_size_reads_the_same(tmp_path, sample_text):
+    path = _write(tmp_path / "c.json", sample_text)
+    for chunk_size in range(1, len(sample_text) + 2):
+        assert list(iter_recipes(path, chunk_size=chunk_size)) == SAMPLE, chunk_size
+
+
+def test_compact_layout(tmp_path):
+    text = json.dumps(SAMPLE, separators=(",", ":"), ensure_ascii=True)
+    path = _write(tmp_path / "c.json", text)
+    for chunk_size in (1, 2, 3, 7, 64):
+        assert list(iter_recipes(path, chunk_size=chunk_size)) == SAMPLE
+
+
+@pytest.mark.parametrize("text", ["[]", " [ ] ", "[\n]\n"])
+def test_empty_array(tmp_path, text):
+    assert list(iter_recipes(_write(tmp_path / "c.json", text), chunk_size=1)) == []
+
+
+def test_every_truncation_is_an_error(tmp_path, sample_text):
+    for cut in range(len(sample_text)):
+        path = _write(tmp_path / "c.json", sample_text[:cut])
+        for chunk_size in (1, 5, 1 << 16):
+            with pytest.raises(ValueError):
+                list(iter_recipes(path, chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("text, message", [
+    ('{"title": "x"}', "expected a JSON array"),
+    ('[{"a": 1} {"b": 2}]', "expected ',' or ']' at character 10"),
+    ('[{"a": tru}]', "invalid JSON at character 7"),
+    ('[{"a": 1,}]', "invalid JSON at character 9"),
+    ('[{"a": 1}, ]', "invalid JSON at character 11"),
+])
+def test_invalid_json_reports_the_same_error_for_any_chunk_size(tmp_path, text, message):
+    path = _write(tmp_path / "c.json", text)
+    for chunk_size in range(1, len(text) + 2):
+        with pytest.raises(ValueError, match=message):
+            list(iter_recipes(path, chunk_size=chunk_size))
+
+
+def test_invalid_json_is_reported_before_the_rest_is_read(tmp_path):
+    good = ",\n".join(json.dumps(r) for r in SAMPLE * 50)
+    path = _write(tmp_path / "c.json", '[{"a": tru},\n' + good + "]")
+    reader = iter_recipes(path, chunk_size=64)
+    with pytest.raises(ValueError, match="invalid JSON at character 7"):
+        next(reader)
+
+
+def test_round_trip_keeps_the_json_dump_layout(tmp_path):
+    path = tmp_path / "recipes.json"
+    shutil.copyfile(BASE / "recipes.json", path)
+    original = path.read_bytes()
+    assert write_recipes(str(path), iter_recipes(str(path))) == len(json.loads(original))
+    assert path.read_bytes() == original
+    assert json.loads(original) == json.load(open(path, encoding="utf-8"))
+
+
+def test_jsonl_round_trip(tmp_path):
+    path = str(tmp_path / "c.jsonl")
+    assert write_recipes(path, SAMPLE) == len(SAMPLE)
+    assert list(iter_recipes(path)) == SAMPLE
+
+
+def test_jsonl_reader_skips_partial_last_line(tmp_path):
+    lines = "".join(json.dumps(r) + "\n" for r in SAMPLE)
+    path = _write(tmp_path / "c.jsonl", lines + '{"title": "half')
+    assert list(iter_recipes(path)) == SAMPLE
+
+
+def test_jsonl_reader_rejects_bad_complete_line(tmp_path):
+    path = _write(tmp_path / "c.jsonl", '{"title": "ok"}\n{"title": \n{"title": "ok"}\n')
+    with pytest.raises(ValueError):
+        list(iter_recipes(path))
+
+
+def test_jsonl_append_truncates_partial_last_line(tmp_path):
+    lines = "".join(json.dumps(r) + "\n" for r in SAMPLE)
+    path = _write(tmp_path / "c.jsonl", lines + '{"title": "half')
+    assert append_recipes(path, [{"title": "new"}]) == 1
+    assert list(iter_recipes(path)) == SAMPLE + [{"title": "new"}]
+    assert Path(path).read_text(encoding="utf-8") == lines + '{"title": "new"}\n'
+
+
+def test_jsonl_append_keeps_complete_last_line_without_newline(tmp_path):
+    path = _write(tmp_path / "c.jsonl", '{"title": "a"}\n{"title": "b"}')
+    append_recipes(path, [{"title": "c"}])
+    assert [r["title"] for r in iter_recipes(path)] == ["a", "b", "c"]
+
+
+def test_jsonl_append_to_single_partial_line(tmp_path):
+    path = _write(tmp_path / "c.jsonl", '{"tit')
+    append_recipes(path, [{"title": "c"}])
+    assert Path(path).read_text(encoding="utf-8") == '{"title": "c"}\n'
+
+
+def test_array_append(tmp_path):
+    path = str(tmp_path / "c.json")
+    write_recipes(path, SAMPLE[:1])
+    assert append_recipes(path, SAMPLE[1:]) == len(SAMPLE) - 1
+    assert list(iter_recipes(path)) == SAMPLE
+
+
+def test_failed_rewrite_leaves_catalog_untouched(tmp_path, sample_text):
+    path = _write(tmp_path / "c.json", sample_text)
+
+    def broken():
+        yield SAMPLE[0]
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        write_recipes(path, broken())
+    assert Path(path).read_text(encoding="utf-8") == sample_text
+    assert os.listdir(tmp_path) == ["c.json"]
+
+
+def test_file_modes(tmp_path):
+    new = str(tmp_path / "new.json")
+    write_recipes(new, SAMPLE)
+    assert os.stat(new).st_mode & 0o777 == default_file_mode()
+
+    existing = str(tmp_path / "existing.json")
+    write_recipes(existing, SAMPLE)
+    os.chmod(existing, 0o640)
+    write_recipes(existing, SAMPLE[:1])
+    assert os.stat(existing).st_mode & 0o777 == 0o640
@@ -0,0 +1,28 @@
+"""
+tests/test_follow_up.py
+=======================
+follow_up_intent drives main()'s follow-up loop and the replay harness's
+step labels, so both must agree on which branch an answer takes.
+"""
+import pytest
+
+from main import follow_up_intent
+
+
+@pytest.mark.parametrize("answer, intent", [
+    ("exit", "exit"),
+    ("No", "exit"),
+    ("no thanks", "ask_openai"),
+    ("I want to make this", "confirm"),
+    ("meal plan", "meal_plan"),
+    ("can you plan my week?", "meal_plan"),
+    ("I don't have butter", "substitute"),
+    ("dont have eggs", "substitute"),
+    ("you don't have to be exact, right?", "ask_openai"),
+    ("how long does it take?", "time"),
+    ("steps", "explain"),
+    ("How do I cook the rice?", "explain"),
+    ("what wine goes with it?", "ask_openai"),
+])
+def test_follow_up_intent(answer, intent):
+    assert follow_up_intent(answer) == intent
@@ -0,0 +1,44 @@
+"""
+tests/test_parse_minutes.py
+===========================
+parse_minutes feeds the minutes index and the time filters in match_recipes.
+"""
+import pytest
+
+from src.recipe_helper import parse_minutes, recipes_within_time
+
+
+@pytest.mark.parametrize("text, minutes", [
+    ("25 minutes", 25),
+    ("45 mins", 45),
+    ("10m", 10),
+    ("1 hour", 60),
+    ("2 hrs", 120),
+    ("2h", 120),
+    ("1 hr 15 min", 75),
+    ("1h30m", 90),
+    ("1h30", 90),
+    ("1.5 hours", 90),
+    ("1 hour 30", 90),
+    ("1 hour and 30", 90),
+    ("1 hour 30 seconds", 60),
+    ("5 min prep + 20 min cook", 25),
+    ("1 hour prep + 30 min cook", 90),
+    ("25", 25),
+    ("About 40 Minutes", 40),
+])
+def test_parse_minutes(text, minutes):
+    assert parse_minutes(text) == minutes
+
+
+@pytest.mark.parametrize("text", ["", None, "overnight"])
+def test_parse_minutes_without_number(text):
+    assert parse_minutes(text) is None
+
+
+def test_recipes_within_time_uses_parsed_minutes():
+    quick = recipes_within_time(max_minutes=20)
+    assert quick
+    assert all(r["minutes"] is not None and r["minutes"] <= 20 for r in quick)
+    window = recipes_within_time(min_minutes=30, max_minutes=40)
+    assert all(30 <= r["minutes"] <= 40 for r in window)
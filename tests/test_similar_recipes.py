@@ -0,0 +1,28 @@
+"""
+tests/test_similar_recipes.py
+=============================
+Zero-result fallback: similar_recipes over the committed neighbour table.
+"""
+from src.recipe_helper import NORMALIZED_INGREDIENTS, RECIPES, normalize, similar_recipes
+
+
+def _has_diet(recipe, diet):
+    return diet in [normalize(d) for d in recipe.get("diets", [])]
+
+
+def test_diet_filter_applies_to_anchors():
+    pantry = ["tofu", "kale"]
+    results = similar_recipes(ingredients=pantry, k=3, diet="vegan")
+    assert results
+    assert all(_has_diet(r, "vegan") for r, _ in results)
+    # Vegan recipes that directly use the pantry must not be crowded out
+    # by non-vegan anchors
+    best_vegan = max(sum(1 for i in ings if i in pantry) / max(1, len(ings))
+                     for ings, r in zip(NORMALIZED_INGREDIENTS, RECIPES) if _has_diet(r, "vegan"))
+    assert results[0][1] >= round(best_vegan, 3)
+
+def test_recipe_neighbours_by_title_and_copy():
+    title = RECIPES[0]["title"]
+    by_title = similar_recipes(recipe=title)
+    assert by_title == similar_recipes(recipe=dict(RECIPES[0]))
+    assert all(r is not RECIPES[0] for r, _ in by_title)